@@ -6,6 +6,111 @@ Decompresses frames received from the network
 import cv2
 import numpy as np
 import struct
+import sys
+from collections import deque
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    TURBOJPEG_AVAILABLE = True
+except ImportError:
+    TURBOJPEG_AVAILABLE = False
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator - run the kernel as plain Python"""
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Shared TurboJPEG instance (False once loading has failed)
+_turbojpeg = None
+
+
+def _get_turbojpeg():
+    """
+    Get the shared TurboJPEG instance, loading libjpeg-turbo on first use
+
+    Returns:
+        TurboJPEG or None: None if the bindings or the library are missing
+    """
+    global _turbojpeg
+    if _turbojpeg is None and TURBOJPEG_AVAILABLE:
+        try:
+            _turbojpeg = TurboJPEG()
+        except (OSError, RuntimeError):
+            # Python bindings installed but the shared library is missing
+            _turbojpeg = False
+    return _turbojpeg or None
+
+
+# Most decoded frames kept for reuse as libjpeg-turbo output arrays
+OUTPUT_POOL_SIZE = 4
+
+
+def _pool_refs(pool, index):
+    """Reference count of pool[index] as seen from inside this function"""
+    return sys.getrefcount(pool[index])
+
+
+# What _pool_refs reports for an array held by nothing but its pool -
+# measured rather than hard-coded, as the count includes interpreter
+# temporaries. None where reference counts are unavailable (no recycling).
+_UNSHARED_REFS = (_pool_refs([np.empty(0)], 0)
+                  if hasattr(sys, 'getrefcount') else None)
+
+
+# Reduced-size decode flags for cv2.imdecode, keyed by scale denominator
+_CV2_REDUCED_FLAGS = {
+    1: cv2.IMREAD_COLOR,
+    2: cv2.IMREAD_REDUCED_COLOR_2,
+    4: cv2.IMREAD_REDUCED_COLOR_4,
+    8: cv2.IMREAD_REDUCED_COLOR_8,
+}
+
+
+@njit(cache=True, nogil=True)
+def scan_frames(buf, start, end):
+    """
+    Find every complete length-prefixed frame in buf[start:end]
+
+    Compiled with nogil, so framing does not hold the GIL - like recv_into
+    and the JPEG decoders, which already release it - and the receive
+    thread does not stall the UI threads.
+
+    Args:
+        buf: numpy.ndarray of uint8 holding the received stream
+        start: Offset of the first frame header
+        end: Offset just past the last received byte
+
+    Returns:
+        numpy.ndarray: (N, 2) int64 array of (payload_offset, payload_length)
+    """
+    # First pass counts frames so the result can be allocated exactly
+    count = 0
+    pos = start
+    while end - pos >= 4:
+        size = ((int(buf[pos]) << 24) | (int(buf[pos + 1]) << 16) |
+                (int(buf[pos + 2]) << 8) | int(buf[pos + 3]))
+        if end - pos - 4 < size:
+            break
+        count += 1
+        pos += 4 + size
+
+    spans = np.empty((count, 2), dtype=np.int64)
+    pos = start
+    for i in range(count):
+        size = ((int(buf[pos]) << 24) | (int(buf[pos + 1]) << 16) |
+                (int(buf[pos + 2]) << 8) | int(buf[pos + 3]))
+        spans[i, 0] = pos + 4
+        spans[i, 1] = size
+        pos += 4 + size
+    return spans
 
 
 class FrameDecoder:
@@ -13,16 +118,99 @@ class FrameDecoder:
 
     def __init__(self):
         """Initialize the decoder"""
-        self.buffer = b''
+        # Pending bytes live in buffer[read_pos:write_pos]; the rest of the
+        # bytearray is spare capacity that the socket can read straight into
+        self.buffer = bytearray()
+        self.read_pos = 0
+        self.write_pos = 0
+
+        # Framing runs as data arrives: ready holds the (offset, length) of
+        # every complete JPEG payload not yet consumed, and scan_pos is where
+        # the next, still incomplete, frame header starts. Offsets are kept
+        # instead of memoryviews so the buffer can still be compacted.
+        self.ready = deque()
+        self.scan_pos = 0
+
+        # Decode at 1/scale_denom of the source size (see set_scale);
+        # frame_scale is the denominator the last decoded frame actually
+        # used, which lags behind scale_denom until the next frame
+        self.scale_denom = 1
+        self.frame_scale = 1
+
+        # Decoded frames are handed out and may be shown or drawn on for a
+        # while, so an output array is only reused by libjpeg-turbo once
+        # nothing outside the pool references it any more. Until then new
+        # frames get fresh arrays (up to OUTPUT_POOL_SIZE are kept).
+        self._output_pool = []
+
+        # libjpeg-turbo decodes straight to BGR without OpenCV's extra copies
+        # The handle is loaded once per process and reused for every frame -
+        # never create a TurboJPEG inside the per-frame path
+        self._tj = _get_turbojpeg()
 
     def add_data(self, data):
         """
         Add received data to the buffer
 
         Args:
-            data: Raw bytes received from the network
+            data: Raw bytes (or any buffer-protocol object) received from the network
         """
-        self.buffer += data
+        size = len(data)
+        with self.get_write_buffer(size) as view:
+            view[:] = data
+        self.commit(size)
+
+    def get_write_buffer(self, size):
+        """
+        Get a writable view of free space at the end of the buffer
+
+        Lets the caller receive directly into the decoder (e.g. with
+        socket.recv_into) instead of copying from a separate buffer.
+        The view must be released before the next call, then commit()
+        the number of bytes actually written.
+
+        Args:
+            size: Number of bytes of free space needed
+
+        Returns:
+            memoryview: Writable view of exactly `size` bytes
+        """
+        if self.write_pos + size > len(self.buffer):
+            self._make_room(size)
+        return memoryview(self.buffer)[self.write_pos:self.write_pos + size]
+
+    def commit(self, size):
+        """Mark bytes written into the view from get_write_buffer as received"""
+        self.write_pos += size
+        self._frame()
+
+    def _frame(self):
+        """Queue every newly completed frame on self.ready"""
+        buf = np.frombuffer(self.buffer, dtype=np.uint8)
+        spans = scan_frames(buf, self.scan_pos, self.write_pos)
+        del buf
+
+        if len(spans):
+            self.ready.extend(spans.tolist())
+            self.scan_pos = int(spans[-1, 0] + spans[-1, 1])
+
+    def _make_room(self, size):
+        """Ensure `size` free bytes follow write_pos"""
+        # Move unread bytes (normally a partial frame) to the front
+        shift = self.read_pos
+        if shift:
+            pending = self.write_pos - shift
+            self.buffer[:pending] = self.buffer[shift:self.write_pos]
+            self.read_pos = 0
+            self.write_pos = pending
+            self.scan_pos -= shift
+            self.ready = deque((offset - shift, length)
+                               for offset, length in self.ready)
+
+        # Grow only when a frame is bigger than the current capacity
+        shortfall = self.write_pos + size - len(self.buffer)
+        if shortfall > 0:
+            self.buffer.extend(bytes(shortfall))
 
     def get_frame(self):
         """
@@ -31,39 +219,150 @@ class FrameDecoder:
         Returns:
             numpy.ndarray or None: Decoded frame in BGR format, or None if incomplete
         """
-        # Need at least 4 bytes for the size header
-        if len(self.buffer) < 4:
+        if not self.ready:
             return None
 
-        # Read the frame size
-        frame_size = struct.unpack('>I', self.buffer[:4])[0]
+        offset, length = self.ready.popleft()
+        frame = self._decode_span(offset, length)
+        self._consume(offset + length)
 
-        # Check if we have the complete frame
-        if len(self.buffer) < 4 + frame_size:
-            return None
+        return frame
+
+    def get_frames(self):
+        """
+        Extract and decode every complete frame in the buffer
+
+        Returns:
+            list: Decoded frames in BGR format, oldest first
+        """
+        frames = []
+        while self.ready:
+            frame = self.get_frame()
+            if frame is not None:
+                frames.append(frame)
+        return frames
+
+    def get_latest_frame(self):
+        """
+        Decode only the newest complete frame in the buffer
 
-        # Extract the frame data
-        frame_data = self.buffer[4:4 + frame_size]
+        Older complete frames are skipped without being decoded - for a live
+        stream only the most recent picture is worth the decode work.
 
-        # Remove processed data from buffer
-        self.buffer = self.buffer[4 + frame_size:]
+        Returns:
+            tuple: (frame, received) where frame is the newest decoded frame
+                   in BGR format (or None) and received is the number of
+                   complete frames consumed, including the skipped ones
+        """
+        received = len(self.ready)
+        if not received:
+            return None, 0
 
-        # Decode the JPEG frame
+        offset, length = self.ready.pop()
+        self.ready.clear()
+        frame = self._decode_span(offset, length)
+        self._consume(offset + length)
+
+        return frame, received
+
+    def _decode_span(self, start, length):
+        """Decode the JPEG payload at buffer[start:start + length]"""
+        # Decode straight out of the buffer (no slice copy)
+        frame_data = memoryview(self.buffer)[start:start + length]
         try:
-            frame_array = np.frombuffer(frame_data, dtype=np.uint8)
-            frame = cv2.imdecode(frame_array, cv2.IMREAD_COLOR)
-            return frame
+            frame = self._decode(frame_data)
         except Exception as e:
             print(f"Decode error: {e}")
+            frame = None
+
+        # Release the view before the buffer is compacted or grown
+        frame_data.release()
+        return frame
+
+    def _decode(self, frame_data):
+        """Decode a single JPEG payload into a BGR frame"""
+        # Read once - set_scale() may be called from another thread
+        denom = self.scale_denom
+        if self._tj is not None:
+            scaling_factor = (1, denom) if denom > 1 else None
+            dst = self._free_output()
+
+            try:
+                frame = self._tj.decode(frame_data, pixel_format=TJPF_BGR,
+                                        scaling_factor=scaling_factor, dst=dst)
+            except ValueError:
+                # Frame size changed since the output buffers were allocated
+                if dst is None:
+                    raise
+                frame = self._tj.decode(frame_data, pixel_format=TJPF_BGR,
+                                        scaling_factor=scaling_factor)
+
+            if frame is not dst:
+                pool = self._output_pool
+                if pool and pool[0].shape != frame.shape:
+                    # New frame size - the old arrays will never fit again
+                    pool.clear()
+                if len(pool) < OUTPUT_POOL_SIZE:
+                    pool.append(frame)
+            self.frame_scale = denom
+            return frame
+
+        frame_array = np.frombuffer(frame_data, dtype=np.uint8)
+        frame = cv2.imdecode(frame_array, _CV2_REDUCED_FLAGS[denom])
+        if frame is not None:
+            self.frame_scale = denom
+        return frame
+
+    def _free_output(self):
+        """
+        Find a pooled output array that no one else holds a reference to
+
+        Returns:
+            numpy.ndarray or None: Array safe to decode into, or None if
+                                   every pooled frame is still in use
+        """
+        if _UNSHARED_REFS is None:
             return None
+        pool = self._output_pool
+        for i in range(len(pool)):
+            if _pool_refs(pool, i) <= _UNSHARED_REFS:
+                return pool[i]
+        return None
+
+    def set_scale(self, denom):
+        """
+        Decode frames at a reduced size
+
+        Both libjpeg-turbo and OpenCV scale during the IDCT, which is much
+        cheaper than a full decode followed by a resize.
+
+        Args:
+            denom: Scale denominator - 1 (full size), 2, 4 or 8
+        """
+        if denom not in _CV2_REDUCED_FLAGS:
+            raise ValueError(f"Unsupported scale denominator: {denom}")
+        self.scale_denom = denom
+
+    def _consume(self, end):
+        """Mark buffer contents up to `end` as processed"""
+        self.read_pos = end
+        if self.read_pos == self.write_pos:
+            # Everything consumed - rewind without moving any data
+            self.read_pos = 0
+            self.write_pos = 0
+            self.scan_pos = 0
 
     def clear(self):
         """Clear the buffer"""
-        self.buffer = b''
+        # Keep the capacity - a receive may still hold a view into it
+        self.read_pos = 0
+        self.write_pos = 0
+        self.scan_pos = 0
+        self.ready.clear()
 
     def buffer_size(self):
         """Get current buffer size"""
-        return len(self.buffer)
+        return self.write_pos - self.read_pos
 
 
 def test_decoder():
@@ -7,7 +7,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
 import cv2
-from PIL import Image, ImageTk
+import numpy as np
 from receiver import StreamingClient
 
 
@@ -25,6 +25,16 @@ class ReceiverLauncher:
         self.is_connected = False
         self.display_window = None
 
+        # Embedded preview state, rebuilt only when the area or frame size changes
+        self._preview_photo = None
+        self._preview_area = (0, 0)
+        self._preview_src = None
+        self._preview_dst = None
+        self._preview_bgr = None
+        self._preview_ppm = None
+        self._preview_rgb = None
+        self._decode_scale_stale = True     # Preview area changed since picked
+
         self._create_widgets()
 
     def _create_widgets(self):
@@ -102,6 +112,7 @@ class ReceiverLauncher:
         self.preview_label = ttk.Label(preview_frame, text="No stream",
                                        anchor=tk.CENTER)
         self.preview_label.pack(fill=tk.BOTH, expand=True)
+        self.preview_label.bind('<Configure>', self._on_preview_configure)
 
         # Log Frame
         log_frame = ttk.LabelFrame(main_frame, text="Log", padding="5")
@@ -194,6 +205,7 @@ class ReceiverLauncher:
         self.host_entry.config(state='normal')
         self.port_entry.config(state='normal')
         self.preview_label.config(image='', text="No stream")
+        self._preview_photo = None
 
         if self.display_window:
             try:
@@ -214,39 +226,98 @@ class ReceiverLauncher:
             if not self.is_connected or not self.client:
                 return
 
-            frame = self.client.get_frame()
+            frame, frame_scale = self.client.get_frame_and_scale()
             if frame is not None:
-                # Resize frame to fit preview
-                preview_width = self.preview_label.winfo_width()
-                preview_height = self.preview_label.winfo_height()
-
-                if preview_width > 1 and preview_height > 1:
-                    # Calculate aspect ratio
-                    h, w = frame.shape[:2]
-                    aspect = w / h
-
-                    if preview_width / preview_height > aspect:
-                        new_height = preview_height
-                        new_width = int(preview_height * aspect)
-                    else:
-                        new_width = preview_width
-                        new_height = int(preview_width / aspect)
-
-                    frame = cv2.resize(frame, (new_width, new_height))
+                # Sizes and buffers only change on resize or a new frame size
+                h, w = frame.shape[:2]
+                if self._preview_src != (w, h):
+                    self._layout_preview(w, h)
+                new_width, new_height = self._preview_dst
+
+                # Let the decoder shrink frames during decode so the resize
+                # below has little left to do; picked again whenever the
+                # preview area changes so the decode size follows it
+                if self._decode_scale_stale and self._preview_area_known():
+                    self._decode_scale_stale = False
+                    # The frame may have been decoded at a reduced size - use
+                    # the scale it was actually decoded at, not the requested
+                    # one, since no new frame arrives while the screen is static
+                    denom = self._pick_decode_scale(w * frame_scale, h * frame_scale,
+                                                    new_width, new_height)
+                    if denom != self.client.decode_scale:
+                        self.client.set_decode_scale(denom)
 
-                # Convert to PhotoImage
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                img = Image.fromarray(frame_rgb)
-                photo = ImageTk.PhotoImage(image=img)
-
-                self.preview_label.config(image=photo, text="")
-                self.preview_label.image = photo
+                # Resize frame to fit preview
+                if (new_width, new_height) != (w, h):
+                    frame = cv2.resize(frame, (new_width, new_height),
+                                       dst=self._preview_bgr)
+
+                # Hand Tk the pixels as binary PPM - no PIL image in between.
+                # The reversed-channel view is RGB and is copied straight into
+                # the pixel area of the preallocated PPM buffer.
+                np.copyto(self._preview_rgb, frame[:, :, ::-1])
+                ppm = bytes(self._preview_ppm)
+
+                # One PhotoImage per connection, refilled in place each tick
+                if self._preview_photo is None:
+                    self._preview_photo = tk.PhotoImage(data=ppm, format='PPM')
+                    self.preview_label.config(image=self._preview_photo, text="")
+                else:
+                    self._preview_photo.configure(data=ppm, format='PPM')
 
             if self.is_connected:
                 self.root.after(33, update_preview)  # ~30 FPS
 
+        self._preview_src = None
+        self._decode_scale_stale = True
         self.root.after(100, update_preview)
 
+    def _on_preview_configure(self, event):
+        """Track the preview area size; the layout is redone on the next frame"""
+        if (event.width, event.height) != self._preview_area:
+            self._preview_area = (event.width, event.height)
+            self._preview_src = None
+            self._decode_scale_stale = True
+
+    def _preview_area_known(self):
+        """Check if the preview area has been laid out by Tk yet"""
+        return self._preview_area[0] > 1 and self._preview_area[1] > 1
+
+    def _layout_preview(self, width, height):
+        """Fit a width x height frame into the preview area and allocate its buffers"""
+        new_width, new_height = width, height
+
+        if self._preview_area_known():
+            preview_width, preview_height = self._preview_area
+
+            # Calculate aspect ratio
+            aspect = width / height
+
+            if preview_width / preview_height > aspect:
+                new_height = preview_height
+                new_width = max(1, int(preview_height * aspect))
+            else:
+                new_width = preview_width
+                new_height = max(1, int(preview_width / aspect))
+
+        self._preview_src = (width, height)
+        self._preview_dst = (new_width, new_height)
+
+        # Resize target, plus a PPM image whose pixel area is exposed as an RGB array
+        header = f"P6 {new_width} {new_height} 255\n".encode()
+        self._preview_bgr = np.empty((new_height, new_width, 3), dtype=np.uint8)
+        self._preview_ppm = bytearray(header) + bytearray(new_width * new_height * 3)
+        self._preview_rgb = np.frombuffer(self._preview_ppm, dtype=np.uint8,
+                                          offset=len(header)).reshape(new_height, new_width, 3)
+
+    @staticmethod
+    def _pick_decode_scale(width, height, target_width, target_height):
+        """Largest decode scale denominator that still covers the target size"""
+        for denom in (8, 4, 2):
+            if width // denom >= target_width and height // denom >= target_height:
+                return denom
+        return 1
+
     def _start_window_display(self):
         """Start displaying stream in separate OpenCV window"""
         self.display_window = True
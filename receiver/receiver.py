@@ -3,38 +3,85 @@ Receiver Module
 Client that connects to the streaming server and displays the stream
 """
 
+import os
 import socket
 import threading
 import time
 import cv2
 from decoder import FrameDecoder
 
+# Size of each socket read - large enough for several frames per syscall
+RECV_BUFFER_SIZE = 1 << 20
+
+# Kernel receive buffer requested for the connection (SO_RCVBUF)
+SOCKET_RCVBUF_SIZE = 4 << 20
+
+# Real-time priority used for the receive thread in low-latency mode
+RECEIVE_THREAD_PRIORITY = 20
+
+
+def _nic_irq_core():
+    """
+    Find a CPU that services network interface interrupts (Linux only)
+
+    Returns:
+        int or None: CPU number, or None if it cannot be determined
+    """
+    try:
+        interfaces = [name for name in os.listdir('/sys/class/net') if name != 'lo']
+        allowed = os.sched_getaffinity(0)
+
+        for irq in os.listdir('/proc/irq'):
+            irq_dir = os.path.join('/proc/irq', irq)
+            if not os.path.isdir(irq_dir):
+                continue
+
+            # Each IRQ directory has an entry named after its handler, e.g. eth0-rx-0
+            handlers = os.listdir(irq_dir)
+            if not any(h.startswith(i) for h in handlers for i in interfaces):
+                continue
+
+            with open(os.path.join(irq_dir, 'smp_affinity_list')) as f:
+                for part in f.read().strip().split(','):
+                    first, _, last = part.partition('-')
+                    for cpu in range(int(first), int(last or first) + 1):
+                        if cpu in allowed:
+                            return cpu
+    except (OSError, ValueError, AttributeError):
+        pass
+    return None
+
 
 class StreamingClient:
     """TCP client that receives and displays the screen stream"""
 
-    def __init__(self, host='127.0.0.1', port=9999):
+    def __init__(self, host='127.0.0.1', port=9999, low_latency=False):
         """
         Initialize the streaming client
 
         Args:
             host: Server IP address to connect to
             port: Server port to connect to
+            low_latency: Pin the receive thread to the NIC's CPU and give it
+                         real-time priority (Linux, needs privileges)
         """
         self.host = host
         self.port = port
+        self.low_latency = low_latency
 
         self.socket = None
         self.decoder = None
+        self.decode_scale = 1
 
         self.running = False
         self.connected = False
 
         self.current_frame = None
+        self.current_frame_scale = 1    # Denominator current_frame was decoded at
         self.frame_lock = threading.Lock()
         self.frame_count = 0
         self.fps = 0
-        self.last_fps_time = time.time()
+        self._last_fps_ns = time.monotonic_ns()
 
         # Callbacks for UI updates
         self.on_frame = None
@@ -46,12 +93,16 @@ class StreamingClient:
         """Connect to the streaming server"""
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Set before connecting so the TCP window scale is negotiated for it
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF,
+                                   SOCKET_RCVBUF_SIZE)
             self.socket.settimeout(5.0)  # Connection timeout
             self.socket.connect((self.host, self.port))
             self.socket.settimeout(None)  # Remove timeout after connection
             self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
             self.decoder = FrameDecoder()
+            self.decoder.set_scale(self.decode_scale)
             self.connected = True
             self.running = True
 
@@ -93,40 +144,39 @@ class StreamingClient:
 
     def _receive_loop(self):
         """Main receive loop - receives and processes frames"""
+        if self.low_latency:
+            self._tune_receive_thread()
+
         while self.running:
             try:
-                # Receive data
-                data = self.socket.recv(65536)
+                # Receive straight into the decoder's buffer (no extra copy)
+                with self.decoder.get_write_buffer(RECV_BUFFER_SIZE) as view:
+                    n = self.socket.recv_into(view)
 
-                if not data:
+                if n == 0:
                     # Connection closed
                     self._notify_status("Server closed connection")
                     self.disconnect()
                     break
 
-                # Add data to decoder
-                self.decoder.add_data(data)
+                # Hand the received bytes to the decoder
+                self.decoder.commit(n)
 
-                # Try to extract frames
-                while True:
-                    frame = self.decoder.get_frame()
-                    if frame is None:
-                        break
-
-                    # Update current frame
+                # Decode only the newest complete frame - older ones are stale
+                frame, received = self.decoder.get_latest_frame()
+                if received:
+                    # Count every received frame so FPS stays truthful
                     with self.frame_lock:
-                        self.current_frame = frame
-                        self.frame_count += 1
+                        if frame is not None:
+                            self.current_frame = frame
+                            self.current_frame_scale = self.decoder.frame_scale
+                        self.frame_count += received
 
-                    # Calculate FPS
-                    current_time = time.time()
-                    if current_time - self.last_fps_time >= 1.0:
-                        self.fps = self.frame_count
-                        self.frame_count = 0
-                        self.last_fps_time = current_time
+                        # Calculate FPS (monotonic integer clock, once per read)
+                        self._update_fps(time.monotonic_ns())
 
                     # Notify callback
-                    if self.on_frame:
+                    if self.on_frame and frame is not None:
                         self.on_frame(frame)
 
             except ConnectionResetError:
@@ -139,14 +189,69 @@ class StreamingClient:
                     self.disconnect()
                 break
 
+    def _tune_receive_thread(self):
+        """Pin the calling thread and raise its scheduling priority"""
+        if not hasattr(os, 'sched_setaffinity'):
+            self._notify_status("Low-latency mode is only supported on Linux")
+            return
+
+        # Staying on the CPU that takes the NIC interrupts avoids migrations
+        core = _nic_irq_core()
+        if core is not None:
+            try:
+                os.sched_setaffinity(0, {core})
+                self._notify_status(f"Receive thread pinned to CPU {core}")
+            except OSError as e:
+                self._notify_status(f"Could not pin receive thread: {e}")
+
+        # Real-time scheduling needs privileges; try a nicer nice value instead
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO,
+                                  os.sched_param(RECEIVE_THREAD_PRIORITY))
+        except OSError:
+            try:
+                os.nice(-5)
+            except OSError:
+                self._notify_status("No permission to raise receive thread priority")
+
     def get_frame(self):
         """Get the current frame"""
         with self.frame_lock:
             return self.current_frame
 
+    def get_frame_and_scale(self):
+        """
+        Get the current frame together with the scale it was decoded at
+
+        Returns:
+            tuple: (frame, denom) - the frame is 1/denom of the source size
+        """
+        with self.frame_lock:
+            return self.current_frame, self.current_frame_scale
+
+    def set_decode_scale(self, denom):
+        """Decode incoming frames at 1/denom size (1, 2, 4 or 8)"""
+        self.decode_scale = denom
+        if self.decoder:
+            self.decoder.set_scale(denom)
+
+    def _update_fps(self, now_ns):
+        """Close the FPS measuring window once a second has passed (frame_lock held)"""
+        elapsed = now_ns - self._last_fps_ns
+        if elapsed >= 1_000_000_000:
+            # Normalised by the real window length, which can be longer
+            # than a second if no frames arrived for a while
+            self.fps = round(self.frame_count * 1_000_000_000 / elapsed)
+            self.frame_count = 0
+            self._last_fps_ns = now_ns
+
     def get_fps(self):
         """Get the current FPS"""
-        return self.fps
+        # The sender goes quiet while its screen is static, so the rate is
+        # also brought up to date here rather than only when frames arrive
+        with self.frame_lock:
+            self._update_fps(time.monotonic_ns())
+            return self.fps
 
     def is_connected(self):
         """Check if connected"""
@@ -174,10 +279,13 @@ def main():
                         help='Server IP address')
     parser.add_argument('--port', type=int, default=9999,
                         help='Server port')
+    parser.add_argument('--low-latency', action='store_true',
+                        help='Pin the receive thread and raise its priority (Linux)')
 
     args = parser.parse_args()
 
-    client = StreamingClient(host=args.host, port=args.port)
+    client = StreamingClient(host=args.host, port=args.port,
+                             low_latency=args.low_latency)
 
     print(f"Connecting to {args.host}:{args.port}...")
 
@@ -56,7 +56,7 @@ class ScreenCapture:
         Capture a single frame from the screen
 
         Returns:
-            numpy.ndarray: The captured frame in BGR format (OpenCV compatible)
+            numpy.ndarray: The captured frame in BGR or BGRX format (OpenCV compatible)
         """
         if self.capture_method == "mss":
             return self._capture_mss()
@@ -77,12 +77,12 @@ class ScreenCapture:
         # Capture the screen
         screenshot = sct.grab(monitor)
 
-        # Convert to numpy array (BGRA format)
-        frame = np.array(screenshot)
-
-        # Convert BGRA to BGR (remove alpha channel)
-        frame = frame[:, :, :3]
+        # Wrap mss's BGRA buffer as a numpy view (no copy)
+        frame = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(
+            screenshot.height, screenshot.width, 4)
 
+        # Keep it as BGRX - the encoder reads 4-channel frames directly,
+        # so dropping the alpha channel here would only cost an extra copy
         return frame
 
     def _capture_pil(self):
@@ -125,8 +125,8 @@ def test_capture():
     frame = capture.capture_frame()
     print(f"Captured frame shape: {frame.shape}")
 
-    # Save a test image
-    cv2.imwrite("test_capture.png", frame)
+    # Save a test image (without the unused alpha channel)
+    cv2.imwrite("test_capture.png", frame[:, :, :3])
     print("Saved test_capture.png")
 
     capture.close()
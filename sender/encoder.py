@@ -6,6 +6,44 @@ Compresses frames for efficient transmission over the network
 import cv2
 import struct
 
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR, TJPF_BGRX, TJSAMP_420
+    TURBOJPEG_AVAILABLE = True
+except ImportError:
+    TURBOJPEG_AVAILABLE = False
+
+# Shared TurboJPEG instance (False once loading has failed)
+_turbojpeg = None
+
+
+def _get_turbojpeg():
+    """
+    Get the shared TurboJPEG instance, loading libjpeg-turbo on first use
+
+    Returns:
+        TurboJPEG or None: None if the bindings or the library are missing
+    """
+    global _turbojpeg
+    if _turbojpeg is None and TURBOJPEG_AVAILABLE:
+        try:
+            _turbojpeg = TurboJPEG()
+        except (OSError, RuntimeError):
+            # Python bindings installed but the shared library is missing
+            _turbojpeg = False
+    return _turbojpeg or None
+
+
+# 4-byte big-endian frame size header
+_HEADER = struct.Struct('>I')
+
+
+def _pyrdown_levels(scale):
+    """Number of exact halvings that give `scale` (0.5 -> 1, 0.25 -> 2), else 0"""
+    for levels in range(1, 5):
+        if abs(scale - 0.5 ** levels) < 1e-3:
+            return levels
+    return 0
+
 
 class FrameEncoder:
     """Handles frame compression and encoding for network transmission"""
@@ -21,42 +59,66 @@ class FrameEncoder:
         self.quality = quality
         self.scale = scale
 
+        # Power-of-two downscales use cv2.pyrDown's fixed-ratio fast path
+        self._pyrdown_levels = _pyrdown_levels(scale)
+
+        # Reused for every cv2.imencode call; set_quality updates it in place
+        self._encode_params = [cv2.IMWRITE_JPEG_QUALITY, int(self.quality)]
+
+        # libjpeg-turbo encodes BGR directly, skipping OpenCV's wrapper copies
+        # The handle is loaded once per process and reused for every frame -
+        # never create a TurboJPEG inside the per-frame path
+        self._tj = _get_turbojpeg()
+
     def encode(self, frame):
         """
         Encode a frame for transmission
 
         Args:
-            frame: numpy.ndarray in BGR format
+            frame: numpy.ndarray in BGR or BGRX (4-channel) format
 
         Returns:
-            bytes: Encoded frame data with size header
+            tuple: (header, payload) - the 4-byte size header as bytes and the
+                   JPEG data as a memoryview, kept separate so they can be
+                   sent with one scatter-gather write instead of concatenated
         """
         # Resize if scale is not 1.0
-        if self.scale != 1.0:
+        if self._pyrdown_levels:
+            for _ in range(self._pyrdown_levels):
+                frame = cv2.pyrDown(frame)
+        elif self.scale != 1.0:
             width = int(frame.shape[1] * self.scale)
             height = int(frame.shape[0] * self.scale)
-            frame = cv2.resize(frame, (width, height), interpolation=cv2.INTER_LINEAR)
+            frame = cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
 
-        # Encode as JPEG
-        encode_params = [cv2.IMWRITE_JPEG_QUALITY, self.quality]
-        _, encoded = cv2.imencode('.jpg', frame, encode_params)
+        # Encode as JPEG (4th channel of BGRX input is ignored by both paths)
+        if self._tj is not None:
+            # 4:2:0 chroma subsampling, as cv2.imencode uses - PyTurboJPEG
+            # defaults to 4:2:2, which makes every frame larger
+            pixel_format = TJPF_BGRX if frame.shape[2] == 4 else TJPF_BGR
+            data = memoryview(self._tj.encode(frame, quality=int(self.quality),
+                                              pixel_format=pixel_format,
+                                              jpeg_subsample=TJSAMP_420))
+        else:
+            _, encoded = cv2.imencode('.jpg', frame, self._encode_params)
 
-        # Convert to bytes
-        data = encoded.tobytes()
+            # Flat byte view of OpenCV's output array (no tobytes() copy)
+            data = encoded.data.cast('B')
 
-        # Prepend the size of the data (4 bytes, big-endian)
-        size = len(data)
-        header = struct.pack('>I', size)
+        # Size of the data (4 bytes, big-endian), sent ahead of the payload
+        header = _HEADER.pack(data.nbytes)
 
-        return header + data
+        return header, data
 
     def set_quality(self, quality):
         """Update the compression quality"""
         self.quality = max(1, min(100, quality))
+        self._encode_params[1] = int(self.quality)
 
     def set_scale(self, scale):
         """Update the scale factor"""
         self.scale = max(0.1, min(1.0, scale))
+        self._pyrdown_levels = _pyrdown_levels(self.scale)
 
 
 def test_encoder():
@@ -68,9 +130,10 @@ def test_encoder():
     print(f"Original frame size: {frame.nbytes} bytes")
 
     encoder = FrameEncoder(quality=50)
-    encoded = encoder.encode(frame)
-    print(f"Encoded size: {len(encoded)} bytes")
-    print(f"Compression ratio: {frame.nbytes / len(encoded):.2f}x")
+    header, payload = encoder.encode(frame)
+    encoded_size = len(header) + payload.nbytes
+    print(f"Encoded size: {encoded_size} bytes")
+    print(f"Compression ratio: {frame.nbytes / encoded_size:.2f}x")
 
 
 if __name__ == "__main__":
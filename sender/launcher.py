@@ -6,7 +6,8 @@ Simple Tkinter GUI for the screen streaming server
 import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
-from sender import StreamingServer
+from collections import deque
+from sender import StreamingServer, detect_local_ip
 
 
 class SenderLauncher:
@@ -22,6 +23,11 @@ class SenderLauncher:
         self.server = None
         self.is_streaming = False
 
+        # Log lines waiting to be written by the Tk thread (oldest dropped
+        # if a burst outpaces it)
+        self._log_q = deque(maxlen=500)
+        self._log_scheduled = False
+
         self._create_widgets()
         self._update_ip_display()
 
@@ -148,15 +154,7 @@ class SenderLauncher:
 
     def _update_ip_display(self):
         """Update the IP address display"""
-        try:
-            import socket
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            ip = s.getsockname()[0]
-            s.close()
-        except:
-            ip = "127.0.0.1"
-
+        ip = detect_local_ip()
         self.ip_label.config(text=f"IP: {ip}")
 
     def _toggle_streaming(self):
@@ -184,8 +182,10 @@ class SenderLauncher:
             # Set callbacks
             self.server.on_status_update = self._log_message
             self.server.on_error = self._log_error
-            self.server.on_client_connect = lambda addr: self._update_clients()
-            self.server.on_client_disconnect = self._update_clients
+            # Client events arrive on the server's I/O thread - hand the
+            # label update to the Tk thread instead of polling the count
+            self.server.on_client_connect = lambda addr: self.root.after(0, self._update_clients)
+            self.server.on_client_disconnect = lambda: self.root.after(0, self._update_clients)
 
             if self.server.start():
                 self.is_streaming = True
@@ -195,7 +195,6 @@ class SenderLauncher:
                 self.port_entry.config(state='disabled')
                 self.scale_combo.config(state='disabled')
                 self._log_message("Streaming started")
-                self._start_client_counter()
             else:
                 messagebox.showerror("Error", "Failed to start server")
 
@@ -224,16 +223,29 @@ class SenderLauncher:
             count = self.server.get_client_count()
             self.clients_label.config(text=f"Clients: {count}")
 
-    def _start_client_counter(self):
-        """Start periodic client count updates"""
-        if self.is_streaming:
-            self._update_clients()
-            self.root.after(1000, self._start_client_counter)
-
     def _log_message(self, message):
-        """Add a message to the log"""
+        """
+        Add a message to the log
+
+        Safe to call from the server's threads: messages are queued and
+        written by the Tk thread in one batch once it is idle.
+        """
+        self._log_q.append(message)
+        if not self._log_scheduled:
+            self._log_scheduled = True
+            self.root.after_idle(self._flush_log)
+
+    def _flush_log(self):
+        """Write all queued log messages with a single insert"""
+        self._log_scheduled = False
+        messages = []
+        while self._log_q:
+            messages.append(self._log_q.popleft())
+        if not messages:
+            return
+
         self.log_text.config(state=tk.NORMAL)
-        self.log_text.insert(tk.END, f"{message}\n")
+        self.log_text.insert(tk.END, "\n".join(messages) + "\n")
         self.log_text.see(tk.END)
         self.log_text.config(state=tk.DISABLED)
 
@@ -1,19 +1,178 @@
 """
 Sender Module
 Main streaming server that captures screen and sends to connected clients
+
+Wire protocol - each client receives a plain TCP byte stream of frames:
+
+    +----------------------+-------------------------------+
+    | length (4 bytes, BE) | JPEG payload (length bytes)   |
+    +----------------------+-------------------------------+
+
+The length is an unsigned 32-bit big-endian integer (struct '>I') counting
+payload bytes only. Frames are always sent whole, so a receiver reads the
+header, then exactly `length` bytes, and can receive straight into a
+preallocated buffer without looking for JPEG markers.
 """
 
+import functools
+import hashlib
+import queue
+import selectors
 import socket
+import sys
 import threading
 import time
+import numpy as np
 from capture import ScreenCapture
 from encoder import FrameEncoder
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Threads encoding frames in parallel (the JPEG encoders release the GIL)
+ENCODER_WORKERS = 2
+
+# sendmsg is not available on Windows
+HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')
+
+# Linux-only: MSG_MORE tells the kernel more data follows immediately, so it
+# fills whole segments; TCP_NOTSENT_LOWAT caps unsent data in the kernel so
+# EVENT_WRITE only fires once the socket queue has actually drained
+MSG_MORE = getattr(socket, 'MSG_MORE', 0)
+NOTSENT_LOWAT = 128 << 10
+
+# Most bytes written to one client per writable event, so a large frame is
+# sent in steps interleaved with the other clients rather than in one go
+SEND_CHUNK = 64 << 10
+
+# Linux load-balances incoming connections across sockets sharing a port
+# with SO_REUSEPORT (opt-in, see StreamingServer's listen_sockets); other
+# platforms always get a single listen socket
+HAS_REUSEPORT = sys.platform.startswith('linux') and hasattr(socket, 'SO_REUSEPORT')
+MAX_LISTEN_SOCKETS = 4
+
+# Status updates closer together than this are coalesced (at most 10/s)
+NOTIFY_INTERVAL = 0.1
+
+
+@functools.lru_cache(maxsize=1)
+def detect_local_ip():
+    """
+    Get this machine's LAN IP address
+
+    Looked up once per process - the address rarely changes while the
+    sender is running.
+
+    Returns:
+        str: IPv4 address, or 127.0.0.1 if none can be determined
+    """
+    try:
+        # Connecting a UDP socket sends nothing; it only picks the route
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
+        finally:
+            s.close()
+    except OSError:
+        pass
+
+    try:
+        return socket.gethostbyname(socket.gethostname())
+    except OSError:
+        return "127.0.0.1"
+
+
+def _frame_digest(payload):
+    """
+    Content hash of an encoded frame, used to spot repeats of the same image
+
+    Args:
+        payload: Encoded JPEG data (any buffer-protocol object)
+
+    Returns:
+        int or bytes: 64-bit digest of the payload
+    """
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_intdigest(payload)
+    return hashlib.blake2b(payload, digest_size=8).digest()
+
+
+def _listen_socket_count(port, requested):
+    """Number of listen sockets to open on `port` when `requested` are asked for"""
+    # Port 0 would give every socket a different ephemeral port
+    if not HAS_REUSEPORT or port == 0:
+        return 1
+    return max(1, min(MAX_LISTEN_SOCKETS, requested))
+
+
+def _unsent(buffers, offset, limit):
+    """
+    Views of the next bytes of `buffers` to send
+
+    Args:
+        buffers: Sequence of memoryviews making up the data
+        offset: Number of bytes already sent
+        limit: Maximum number of bytes to return
+
+    Returns:
+        list: Views covering at most `limit` bytes starting at `offset`
+    """
+    views = []
+    for buf in buffers:
+        if limit <= 0:
+            break
+        if offset >= buf.nbytes:
+            offset -= buf.nbytes
+            continue
+        view = buf[offset:offset + limit]
+        views.append(view)
+        limit -= view.nbytes
+        offset = 0
+    return views
+
+
+class ClientState:
+    """Send state for one connected client"""
+
+    def __init__(self, sock, address):
+        """
+        Initialize the client state
+
+        Args:
+            sock: Non-blocking client socket
+            address: Client address as returned by accept()
+        """
+        self.sock = sock
+        self.address = address
+
+        # At most two frames are held per client: the one being sent (which
+        # must go out whole to keep the stream framed) and the newest one
+        # waiting behind it. A newer frame replaces the waiting one, so a
+        # slow client skips stale frames instead of queueing them.
+        self.frame = None           # (header, payload) views being sent
+        self.frame_size = 0         # Total bytes in self.frame
+        self.offset = 0             # Bytes of self.frame already sent
+        self.pending = None         # Newest frame waiting to be sent
+
+        self.registered = False     # Known to the I/O thread's selector
+        self.writing = False        # Selector is watching for EVENT_WRITE
+
+    def has_data(self):
+        """Check if anything is left to send"""
+        if self.pending is not None:
+            return True
+        return self.frame is not None and self.offset < self.frame_size
+
 
 class StreamingServer:
     """TCP server that streams screen capture to connected clients"""
 
-    def __init__(self, host='0.0.0.0', port=9999, quality=50, fps=30, scale=1.0):
+    def __init__(self, host='0.0.0.0', port=9999, quality=50, fps=30, scale=1.0,
+                 listen_sockets=1):
         """
         Initialize the streaming server
 
@@ -23,20 +182,60 @@ class StreamingServer:
             quality: JPEG compression quality (1-100)
             fps: Target frames per second
             scale: Scale factor for frame size
+            listen_sockets: Listen sockets sharing the port via SO_REUSEPORT
+                            (Linux only, at most MAX_LISTEN_SOCKETS); only
+                            worth raising for large bursts of connections
         """
         self.host = host
+        self.listen_sockets = listen_sockets
         self.port = port
         self.fps = fps
         self.quality = quality
         self.scale = scale
 
-        self.server_socket = None
+        self.server_sockets = []
         self.capture = None
         self.encoder = None
 
         self.running = False
-        self.clients = []
-        self.clients_lock = threading.Lock()
+        self._stop_ev = threading.Event()
+        self._fps_dirty = False         # set_fps() changed the frame time
+        self._settings_dirty = False    # Quality/scale changed - re-encode
+
+        # Event loop that accepts clients and writes queued frames as client
+        # sockets become writable, so a slow client never blocks capture or
+        # other clients. Only the I/O thread changes the clients, and it
+        # replaces the tuple instead of mutating it (copy-on-write), so any
+        # thread can read a consistent snapshot without a lock. Encoded
+        # frames reach it through a one-slot queue where the newest frame
+        # replaces an undelivered one.
+        self.clients = ()
+        self._frame_q = queue.Queue(maxsize=1)
+        self._sel = None
+        self._wake_r = None
+        self._wake_w = None
+        self._io_thread = None
+
+        # Capture hands raw frames to the encoder pool through a single
+        # latest-wins slot; frames are sequence-numbered so a slow encode
+        # can never be broadcast after a newer frame
+        self._raw_cv = threading.Condition()
+        self._raw_slot = None
+        self._publish_lock = threading.Lock()
+        self._last_published = 0
+        self._last_digest = None    # Hash of the last frame broadcast
+
+        # Most recent frame handed to the clients; a static screen is not
+        # re-sent, so new clients are given this one on connect
+        self._last_frame = None
+
+        # Rate limiting for status updates - a burst of client churn is
+        # folded into one update instead of flooding the UI with them
+        self._notify_lock = threading.Lock()
+        self._last_notify = 0.0
+        self._pending_msg = None
+        self._skipped_msgs = 0
+        self._notify_timer = None
 
         # Callbacks for UI updates
         self.on_client_connect = None
@@ -51,18 +250,52 @@ class StreamingServer:
             self.capture = ScreenCapture()
             self.encoder = FrameEncoder(quality=self.quality, scale=self.scale)
 
-            # Create server socket
-            self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.server_socket.bind((self.host, self.port))
-            self.server_socket.listen(5)
-            self.server_socket.settimeout(1.0)  # Allow checking for stop
+            # Create server sockets - several bound to the same port with
+            # SO_REUSEPORT when asked for, so the kernel spreads a burst of
+            # connections across their accept queues
+            count = _listen_socket_count(self.port, self.listen_sockets)
+            if count > 1:
+                # SO_REUSEPORT would let this bind succeed alongside another
+                # sender on the port - probe with a plain socket first so
+                # that still fails with "address in use"
+                probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                try:
+                    probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                    probe.bind((self.host, self.port))
+                finally:
+                    probe.close()
+
+            for _ in range(count):
+                server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                self.server_sockets.append(server_socket)
+                server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                if count > 1:
+                    server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                server_socket.bind((self.host, self.port))
+                server_socket.listen(5)
+                server_socket.setblocking(False)
+
+            # Selector watching the listen sockets and clients, plus a socket
+            # pair used to wake it when frames are queued
+            self._sel = selectors.DefaultSelector()
+            for server_socket in self.server_sockets:
+                self._sel.register(server_socket, selectors.EVENT_READ)
+            self._wake_r, self._wake_w = socket.socketpair()
+            self._wake_r.setblocking(False)
+            self._wake_w.setblocking(False)
+            self._sel.register(self._wake_r, selectors.EVENT_READ)
 
             self.running = True
+            self._stop_ev.clear()
 
-            # Start accept thread
-            accept_thread = threading.Thread(target=self._accept_clients, daemon=True)
-            accept_thread.start()
+            # Start the I/O thread (accepts clients and writes frames)
+            self._io_thread = threading.Thread(target=self._io_loop, daemon=True)
+            self._io_thread.start()
+
+            # Start encoder threads
+            for _ in range(ENCODER_WORKERS):
+                encode_thread = threading.Thread(target=self._encode_loop, daemon=True)
+                encode_thread.start()
 
             # Start streaming thread
             stream_thread = threading.Thread(target=self._stream_loop, daemon=True)
@@ -78,22 +311,50 @@ class StreamingServer:
     def stop(self):
         """Stop the streaming server"""
         self.running = False
-
-        # Close all client connections
-        with self.clients_lock:
-            for client in self.clients:
-                try:
-                    client.close()
-                except:
-                    pass
-            self.clients.clear()
-
-        # Close server socket
-        if self.server_socket:
+        self._stop_ev.set()
+
+        # Release encoder threads waiting for a frame
+        with self._raw_cv:
+            self._raw_slot = None
+            self._raw_cv.notify_all()
+
+        # Let the I/O thread leave select() before its sockets are closed
+        if self._io_thread:
+            self._wake()
+            self._io_thread.join(timeout=2.0)
+            self._io_thread = None
+
+        # Close all client connections (the I/O thread has exited)
+        clients, self.clients = self.clients, ()
+        for client in clients:
+            try:
+                client.sock.close()
+            except:
+                pass
+        try:
+            self._frame_q.get_nowait()
+        except queue.Empty:
+            pass
+        self._last_frame = None
+        self._last_digest = None
+        self._last_published = 0
+
+        # Close the I/O thread's selector and wake-up sockets
+        if self._sel:
+            self._sel.close()
+            self._sel = None
+        for sock in (self._wake_r, self._wake_w):
+            if sock:
+                sock.close()
+        self._wake_r = self._wake_w = None
+
+        # Close server sockets
+        for server_socket in self.server_sockets:
             try:
-                self.server_socket.close()
+                server_socket.close()
             except:
                 pass
+        self.server_sockets.clear()
 
         # Close capture
         if self.capture:
@@ -101,124 +362,407 @@ class StreamingServer:
 
         self._notify_status("Server stopped")
 
-    def _accept_clients(self):
-        """Accept incoming client connections"""
-        while self.running:
+    def _stream_loop(self):
+        """Main streaming loop - captures frames and hands them to the encoders"""
+        # Look up everything used per frame once, outside the loop
+        capture_frame = self.capture.capture_frame
+        raw_cv = self._raw_cv
+        stopped = self._stop_ev.is_set
+        wait = self._stop_ev.wait
+        perf_counter = time.perf_counter
+
+        self._fps_dirty = False
+        frame_time = 1.0 / self.fps
+
+        seq = 0
+        prev_frame = None
+        deadline = perf_counter()
+        while not stopped():
             try:
-                client_socket, address = self.server_socket.accept()
-                client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                # Capture frame
+                frame = capture_frame()
+
+                # Skip the encoders entirely while the screen is unchanged -
+                # comparing the raw pixels costs far less than a JPEG encode.
+                # Each capture is a new array, so the previous one can be
+                # kept as is without copying.
+                if self._settings_dirty:
+                    self._settings_dirty = False
+                    prev_frame = None
+                unchanged = (prev_frame is not None and prev_frame.shape == frame.shape
+                             and np.array_equal(prev_frame, frame))
+                prev_frame = frame
+
+                if not unchanged:
+                    seq += 1
+
+                    # Replace any frame the encoders have not picked up yet
+                    with raw_cv:
+                        self._raw_slot = (seq, frame)
+                        raw_cv.notify()
 
-                with self.clients_lock:
-                    self.clients.append(client_socket)
+            except Exception as e:
+                self._notify_error(f"Stream error: {e}")
 
-                self._notify_status(f"Client connected: {address}")
-                if self.on_client_connect:
-                    self.on_client_connect(address)
+            # Frame time is only recomputed after set_fps() changes it
+            if self._fps_dirty:
+                self._fps_dirty = False
+                frame_time = 1.0 / self.fps
+
+            # Maintain target FPS on a fixed schedule of deadlines, so sleep
+            # granularity does not accumulate as drift. Waiting on the stop
+            # event lets stop() interrupt the wait immediately.
+            deadline += frame_time
+            delay = deadline - perf_counter()
+            if delay > 0:
+                wait(delay)
+            elif delay < -frame_time:
+                # More than a frame behind - resync rather than burst
+                deadline = perf_counter()
+
+    def _encode_loop(self):
+        """Encoder thread - encodes the newest captured frame and broadcasts it"""
+        while True:
+            with self._raw_cv:
+                while self.running and self._raw_slot is None:
+                    self._raw_cv.wait()
+                if not self.running:
+                    return
+                seq, frame = self._raw_slot
+                self._raw_slot = None
 
-            except socket.timeout:
-                continue
+            try:
+                encoded_data = self.encoder.encode(frame)
+                digest = _frame_digest(encoded_data[1])
             except Exception as e:
-                if self.running:
-                    self._notify_error(f"Accept error: {e}")
+                self._notify_error(f"Encode error: {e}")
+                continue
 
-    def _stream_loop(self):
-        """Main streaming loop - captures and sends frames"""
-        while self.running:
-            start_time = time.time()
+            # Send to all connected clients, unless a newer frame already went
+            # out or the image is identical to the last one sent (static screen)
+            with self._publish_lock:
+                if seq > self._last_published:
+                    self._last_published = seq
+                    if digest != self._last_digest:
+                        self._last_digest = digest
+                        self._broadcast(encoded_data)
+
+    def _broadcast(self, data):
+        """Queue an encoded (header, payload) frame for all connected clients"""
+        header, payload = data
+
+        # The same header and payload views are shared by every client and
+        # never concatenated - each client only tracks its own offset
+        frame = (memoryview(header), payload)
 
+        # Called under _publish_lock, so there is only ever one producer:
+        # after dropping the undelivered frame the put cannot fail
+        try:
+            self._frame_q.put_nowait(frame)
+        except queue.Full:
             try:
-                # Capture frame
-                frame = self.capture.capture_frame()
+                self._frame_q.get_nowait()
+            except queue.Empty:
+                pass
+            self._frame_q.put_nowait(frame)
 
-                # Encode frame
-                encoded_data = self.encoder.encode(frame)
+        self._wake()
+
+    def _wake(self):
+        """Wake the I/O thread out of select()"""
+        try:
+            self._wake_w.send(b'\0')
+        except (AttributeError, OSError):
+            pass  # Wake-up already pending, or server stopped
+
+    def _io_loop(self):
+        """Accept new clients and write queued frame data whenever sockets can take it"""
+        while self.running:
+            try:
+                events = self._sel.select()
+            except (OSError, ValueError):
+                break
+
+            # This thread serves every client, so an unexpected error is
+            # reported and the loop carries on rather than letting it die
+            dropped = []
+            for key, mask in events:
+                try:
+                    if key.fileobj is self._wake_r:
+                        self._drain_wake()
+                        self._take_frame()
+                        continue
+                    if key.fileobj in self.server_sockets:
+                        self._accept_clients(key.fileobj)
+                        continue
+
+                    client = key.data
+                    if mask & selectors.EVENT_READ and not self._read_client(client):
+                        dropped.append(client)
+                    elif mask & selectors.EVENT_WRITE and not self._write_client(client):
+                        dropped.append(client)
+                except Exception as e:
+                    self._notify_error(f"I/O error: {e}")
+                    if isinstance(key.data, ClientState):
+                        dropped.append(key.data)
 
-                # Send to all connected clients
-                self._broadcast(encoded_data)
+            try:
+                for client in dropped:
+                    self._drop_client(client)
 
+                self._update_interest()
             except Exception as e:
-                self._notify_error(f"Stream error: {e}")
+                self._notify_error(f"I/O error: {e}")
 
-            # Maintain target FPS (recalculate each loop so changes take effect)
-            elapsed = time.time() - start_time
-            frame_time = 1.0 / self.fps
-            sleep_time = frame_time - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+    def _take_frame(self):
+        """Hand the newest encoded frame, if any, to every client"""
+        try:
+            frame = self._frame_q.get_nowait()
+        except queue.Empty:
+            return
+
+        self._last_frame = frame
+        for client in self.clients:
+            # Latest frame wins - an unsent older one is dropped whole
+            client.pending = frame
+
+    def _accept_clients(self, server_socket):
+        """Accept every connection waiting on a listen socket"""
+        while True:
+            try:
+                client_socket, address = server_socket.accept()
+            except BlockingIOError:
+                return
+            except OSError as e:
+                if self.running:
+                    self._notify_error(f"Accept error: {e}")
+                return
 
-    def _broadcast(self, data):
-        """Send data to all connected clients"""
-        disconnected = []
-        disconnect_count = 0
+            try:
+                client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                if hasattr(socket, 'TCP_NOTSENT_LOWAT'):
+                    client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NOTSENT_LOWAT,
+                                             NOTSENT_LOWAT)
+                client_socket.setblocking(False)
+            except OSError as e:
+                client_socket.close()
+                self._notify_error(f"Accept error: {e}")
+                continue
 
-        with self.clients_lock:
-            for client in self.clients:
-                try:
-                    client.sendall(data)
-                except Exception:
-                    disconnected.append(client)
+            # Registered with the selector by _update_interest below
+            client = ClientState(client_socket, address)
+            self.clients = self.clients + (client,)
 
-            # Remove disconnected clients
-            for client in disconnected:
-                self.clients.remove(client)
-                try:
-                    client.close()
-                except:
-                    pass
-                disconnect_count += 1
-
-        # Notify outside the lock to avoid deadlock
-        for _ in range(disconnect_count):
-            self._notify_status("Client disconnected")
-            if self.on_client_disconnect:
+            # Start the newcomer on the current image right away, even if
+            # the screen is static and nothing new will be broadcast
+            client.pending = self._last_frame
+
+            self._notify_status(f"Client connected: {address}")
+            if self.on_client_connect:
                 try:
-                    self.on_client_disconnect()
-                except Exception:
-                    pass
+                    self.on_client_connect(address)
+                except Exception as e:
+                    self._notify_error(f"Connect callback failed: {e}")
+
+    def _drain_wake(self):
+        """Discard pending wake-up bytes"""
+        try:
+            while self._wake_r.recv(4096):
+                pass
+        except OSError:
+            pass
+
+    def _read_client(self, client):
+        """
+        Handle a readable client socket - viewers never send data, so this
+        only detects closed connections
+
+        Returns:
+            bool: False if the client has disconnected
+        """
+        try:
+            return bool(client.sock.recv(4096))
+        except BlockingIOError:
+            return True
+        except OSError:
+            return False
+
+    def _write_client(self, client):
+        """
+        Send as much queued data as the client socket accepts
+
+        Returns:
+            bool: False if the client has disconnected
+        """
+        # Start on the newest frame once the current one is fully sent
+        if client.frame is None or client.offset == client.frame_size:
+            client.frame, client.pending = client.pending, None
+            client.offset = 0
+            if client.frame is None:
+                return True
+            client.frame_size = sum(buf.nbytes for buf in client.frame)
+
+        # Header and payload go out in one scatter-gather call, at most
+        # SEND_CHUNK bytes at a time; slicing the memoryviews does not copy
+        # anything. If a newer frame is already waiting, it joins the same
+        # call behind the tail of the current one (at most four buffers, far
+        # below IOV_MAX).
+        views = _unsent(client.frame, client.offset, SEND_CHUNK)
+        remaining = client.frame_size - client.offset
+        if client.pending is not None:
+            pending_size = sum(buf.nbytes for buf in client.pending)
+            if HAS_SENDMSG and remaining < SEND_CHUNK:
+                views += _unsent(client.pending, 0, SEND_CHUNK - remaining)
+            remaining += pending_size
+
+        # While more data follows this chunk, MSG_MORE lets the kernel hold
+        # back a partial segment until it can be filled
+        flags = MSG_MORE if remaining > SEND_CHUNK else 0
+
+        try:
+            if HAS_SENDMSG:
+                sent = client.sock.sendmsg(views, (), flags)
+            else:
+                sent = client.sock.send(views[0], flags)
+        except BlockingIOError:
+            return True
+        except OSError:
+            return False
+
+        client.offset += sent
+        if client.offset > client.frame_size:
+            # Part of the waiting frame went out too - it is now the frame
+            # being sent and can no longer be replaced
+            client.offset -= client.frame_size
+            client.frame, client.pending = client.pending, None
+            client.frame_size = pending_size
+        return True
+
+    def _update_interest(self):
+        """Register new clients and watch for writability only while data is queued"""
+        # Iterating the snapshot is safe even if a client is dropped
+        for client in self.clients:
+            writing = client.has_data()
+            events = selectors.EVENT_READ
+            if writing:
+                events |= selectors.EVENT_WRITE
+
+            try:
+                if not client.registered:
+                    self._sel.register(client.sock, events, client)
+                    client.registered = True
+                elif writing != client.writing:
+                    self._sel.modify(client.sock, events, client)
+                client.writing = writing
+            except (OSError, ValueError, KeyError):
+                self._drop_client(client)
+
+    def _drop_client(self, client):
+        """Remove a disconnected client and notify listeners"""
+        if client not in self.clients:
+            return
+        self.clients = tuple(c for c in self.clients if c is not client)
+
+        if client.registered:
+            try:
+                self._sel.unregister(client.sock)
+            except (KeyError, ValueError):
+                pass
+        try:
+            client.sock.close()
+        except:
+            pass
+
+        self._notify_status("Client disconnected")
+        if self.on_client_disconnect:
+            try:
+                self.on_client_disconnect()
+            except Exception:
+                pass
 
     def get_client_count(self):
         """Get the number of connected clients"""
-        with self.clients_lock:
-            return len(self.clients)
+        # Reads the current snapshot - no lock needed
+        return len(self.clients)
 
     def set_quality(self, quality):
         """Update streaming quality"""
         self.quality = quality
         if self.encoder:
             self.encoder.set_quality(quality)
+        self._settings_dirty = True
 
     def set_fps(self, fps):
         """Update target FPS"""
         self.fps = max(1, min(60, fps))
+        self._fps_dirty = True
 
     def set_scale(self, scale):
         """Update frame scale"""
         self.scale = scale
         if self.encoder:
             self.encoder.set_scale(scale)
+        self._settings_dirty = True
 
     def _notify_status(self, message):
-        """Notify status update"""
-        print(f"[SERVER] {message}")
+        """
+        Notify status update
+
+        Updates arriving within NOTIFY_INTERVAL of the previous one are held
+        back; only the newest is delivered when the interval ends.
+        """
+        with self._notify_lock:
+            now = time.monotonic()
+            wait = self._last_notify + NOTIFY_INTERVAL - now
+            if wait > 0:
+                if self._pending_msg is not None:
+                    self._skipped_msgs += 1
+                self._pending_msg = message
+                if self._notify_timer is None:
+                    self._notify_timer = threading.Timer(wait, self._flush_status)
+                    self._notify_timer.daemon = True
+                    self._notify_timer.start()
+                return
+            self._last_notify = now
+
+        self._emit_status(message)
+
+    def _flush_status(self):
+        """Deliver the status update held back by _notify_status"""
+        with self._notify_lock:
+            message, skipped = self._pending_msg, self._skipped_msgs
+            self._pending_msg = None
+            self._skipped_msgs = 0
+            self._notify_timer = None
+            self._last_notify = time.monotonic()
+
+        if message is not None:
+            if skipped:
+                message = f"{message} (+{skipped} earlier updates)"
+            self._emit_status(message)
+
+    def _emit_status(self, message):
+        """Print and forward a status update"""
+        if __debug__:
+            print(f"[SERVER] {message}")
         if self.on_status_update:
-            self.on_status_update(message)
+            try:
+                self.on_status_update(message)
+            except Exception as e:
+                print(f"[ERROR] Status callback failed: {e}")
 
     def _notify_error(self, message):
         """Notify error"""
         print(f"[ERROR] {message}")
         if self.on_error:
-            self.on_error(message)
+            try:
+                self.on_error(message)
+            except Exception as e:
+                print(f"[ERROR] Error callback failed: {e}")
 
     def get_local_ip(self):
         """Get the local IP address"""
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            ip = s.getsockname()[0]
-            s.close()
-            return ip
-        except:
-            return "127.0.0.1"
+        return detect_local_ip()
 
 
 def main():
@@ -230,6 +774,8 @@ def main():
     parser.add_argument('--quality', type=int, default=50, help='JPEG quality (1-100)')
     parser.add_argument('--fps', type=int, default=30, help='Target FPS')
     parser.add_argument('--scale', type=float, default=1.0, help='Scale factor (0.1-1.0)')
+    parser.add_argument('--listen-sockets', type=int, default=1,
+                        help='Listen sockets sharing the port (Linux SO_REUSEPORT)')
 
     args = parser.parse_args()
 
@@ -237,7 +783,8 @@ def main():
         port=args.port,
         quality=args.quality,
         fps=args.fps,
-        scale=args.scale
+        scale=args.scale,
+        listen_sockets=args.listen_sockets
     )
 
     print(f"Starting server...")